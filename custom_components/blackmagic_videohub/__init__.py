@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import partial
 import logging
 from typing import Any
 
@@ -9,39 +12,181 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_CHANGES,
+    ATTR_CSV,
+    ATTR_END,
     ATTR_ENTRY_ID,
+    ATTR_FORMAT,
+    ATTR_HOPS,
     ATTR_INPUT,
+    ATTR_INPUT_LABEL,
+    ATTR_INPUT_LABELS,
+    ATTR_LIMIT,
     ATTR_OUTPUT,
+    ATTR_OUTPUT_LABEL,
+    ATTR_OUTPUT_LABELS,
+    ATTR_SOURCE,
+    ATTR_SOURCE_ENTRY_ID,
+    ATTR_START,
+    ATTR_TIME,
+    CONF_DESTINATION_ENTRY_ID,
+    CONF_DESTINATION_INPUT,
+    CONF_PROXY_PORT,
+    CONF_ROUTE_EVENT_DEBOUNCE,
     CONF_SCAN_INTERVAL,
+    CONF_SOURCE_ENTRY_ID,
+    CONF_SOURCE_OUTPUT,
+    CONF_TIE_LINES,
+    DATA_TOPOLOGY,
+    DEFAULT_HISTORY_QUERY_LIMIT,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS,
     DEFAULT_SCAN_INTERVAL_SECONDS,
     DOMAIN,
+    LABEL_FORMAT_CSV,
+    LABEL_FORMAT_JSON,
     PLATFORMS,
+    SERVICE_EXPORT_LABELS,
+    SERVICE_GET_ROUTE_HISTORY,
+    SERVICE_IMPORT_LABELS,
+    SERVICE_ROUTE_BY_LABEL,
     SERVICE_ROUTE_OUTPUT,
+    SERVICE_ROUTE_PATH,
+    STORAGE_VERSION,
+    TIE_LINE_CLAIMS_SAVE_DELAY_SECONDS,
+    TIE_LINE_CLAIMS_STORAGE_KEY,
 )
-from .coordinator import BlackmagicVideohubCoordinator
-from .videohub import BlackmagicVideohubClient
+from .coordinator import BlackmagicVideohubCoordinator, history_storage_key
+from .labels import LabelLookupError, diff_labels, labels_from_csv, labels_to_csv
+from .proxy import VideohubProxyServer
+from .topology import TieLine, TieLineTopology
+from .videohub import BlackmagicVideohubClient, VideohubState, clean_label
 
 _LOGGER = logging.getLogger(__name__)
 
-ROUTE_SERVICE_SCHEMA = vol.Schema(
+TIE_LINE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SOURCE_ENTRY_ID): cv.string,
+        vol.Required(CONF_SOURCE_OUTPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(CONF_DESTINATION_ENTRY_ID): cv.string,
+        vol.Required(CONF_DESTINATION_INPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {vol.Optional(CONF_TIE_LINES, default=[]): vol.All(cv.ensure_list, [TIE_LINE_SCHEMA])}
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+ROUTE_SERVICE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTRY_ID): cv.string,
+            vol.Exclusive(ATTR_OUTPUT, ATTR_OUTPUT): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+            vol.Exclusive(ATTR_OUTPUT_LABEL, ATTR_OUTPUT): cv.string,
+            vol.Exclusive(ATTR_INPUT, ATTR_INPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Exclusive(ATTR_INPUT_LABEL, ATTR_INPUT): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_OUTPUT, ATTR_OUTPUT_LABEL),
+    cv.has_at_least_one_key(ATTR_INPUT, ATTR_INPUT_LABEL),
+)
+
+ROUTE_BY_LABEL_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Required(ATTR_OUTPUT_LABEL): cv.string,
+        vol.Required(ATTR_INPUT_LABEL): cv.string,
+    }
+)
+
+ROUTE_PATH_SERVICE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_SOURCE_ENTRY_ID): cv.string,
+            vol.Exclusive(ATTR_INPUT, ATTR_INPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Exclusive(ATTR_INPUT_LABEL, ATTR_INPUT): cv.string,
+            vol.Required(ATTR_ENTRY_ID): cv.string,
+            vol.Exclusive(ATTR_OUTPUT, ATTR_OUTPUT): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+            vol.Exclusive(ATTR_OUTPUT_LABEL, ATTR_OUTPUT): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_OUTPUT, ATTR_OUTPUT_LABEL),
+    cv.has_at_least_one_key(ATTR_INPUT, ATTR_INPUT_LABEL),
+)
+
+ROUTE_HISTORY_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_OUTPUT): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=0))]
+        ),
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_HISTORY_QUERY_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+
+EXPORT_LABELS_SERVICE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_ENTRY_ID): cv.string,
-        vol.Required(ATTR_OUTPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
-        vol.Required(ATTR_INPUT): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_FORMAT, default=LABEL_FORMAT_JSON): vol.In(
+            [LABEL_FORMAT_JSON, LABEL_FORMAT_CSV]
+        ),
     }
 )
 
+# The device drops empty labels, so they could never match the cached state.
+LABELS_SCHEMA = vol.Schema(
+    {
+        vol.Coerce(int): vol.All(
+            cv.string, clean_label, vol.Length(min=1, msg="Labels must not be empty")
+        )
+    }
+)
+
+IMPORT_LABELS_SERVICE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_INPUT_LABELS): LABELS_SCHEMA,
+            vol.Optional(ATTR_OUTPUT_LABELS): LABELS_SCHEMA,
+            vol.Optional(ATTR_CSV): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_INPUT_LABELS, ATTR_OUTPUT_LABELS, ATTR_CSV),
+)
+
 
 @dataclass(slots=True)
 class BlackmagicVideohubRuntimeData:
     coordinator: BlackmagicVideohubCoordinator
+    proxy: VideohubProxyServer | None = None
 
 
 BlackmagicVideohubConfigEntry = ConfigEntry
@@ -49,6 +194,30 @@ BlackmagicVideohubConfigEntry = ConfigEntry
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     hass.data.setdefault(DOMAIN, {})
+    domain_config = config.get(DOMAIN, {})
+    claims_store: Store[dict[str, Any]] = Store(
+        hass, STORAGE_VERSION, TIE_LINE_CLAIMS_STORAGE_KEY
+    )
+    topology = TieLineTopology(
+        (
+            TieLine(
+                source_entry_id=tie_line[CONF_SOURCE_ENTRY_ID],
+                source_output=tie_line[CONF_SOURCE_OUTPUT],
+                destination_entry_id=tie_line[CONF_DESTINATION_ENTRY_ID],
+                destination_input=tie_line[CONF_DESTINATION_INPUT],
+            )
+            for tie_line in domain_config.get(CONF_TIE_LINES, [])
+        ),
+        on_claims_changed=lambda: claims_store.async_delay_save(
+            topology.claims_as_dict, TIE_LINE_CLAIMS_SAVE_DELAY_SECONDS
+        ),
+    )
+    if claims_data := await claims_store.async_load():
+        try:
+            topology.load_claims(claims_data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding unreadable tie-line claims: %s", err)
+    hass.data[DATA_TOPOLOGY] = topology
 
     if not hass.services.has_service(DOMAIN, SERVICE_ROUTE_OUTPUT):
         hass.services.async_register(
@@ -58,6 +227,50 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
             schema=ROUTE_SERVICE_SCHEMA,
         )
 
+    if not hass.services.has_service(DOMAIN, SERVICE_ROUTE_BY_LABEL):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ROUTE_BY_LABEL,
+            _make_route_output_service_handler(hass),
+            schema=ROUTE_BY_LABEL_SERVICE_SCHEMA,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_ROUTE_PATH):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_ROUTE_PATH,
+            _make_route_path_service_handler(hass),
+            schema=ROUTE_PATH_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_EXPORT_LABELS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_LABELS,
+            _make_export_labels_service_handler(hass),
+            schema=EXPORT_LABELS_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_IMPORT_LABELS):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_LABELS,
+            _make_import_labels_service_handler(hass),
+            schema=IMPORT_LABELS_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_GET_ROUTE_HISTORY):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_GET_ROUTE_HISTORY,
+            _make_get_route_history_service_handler(hass),
+            schema=ROUTE_HISTORY_SERVICE_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+
     return True
 
 
@@ -74,43 +287,142 @@ async def async_setup_entry(hass: HomeAssistant, entry: BlackmagicVideohubConfig
     except (TypeError, ValueError):
         scan_seconds = DEFAULT_SCAN_INTERVAL_SECONDS
     update_interval = None if scan_seconds <= 0 else timedelta(seconds=scan_seconds)
+    debounce_raw: Any = entry.options.get(
+        CONF_ROUTE_EVENT_DEBOUNCE,
+        entry.data.get(CONF_ROUTE_EVENT_DEBOUNCE, DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS),
+    )
+    try:
+        route_event_debounce = max(float(debounce_raw), 0.0)
+    except (TypeError, ValueError):
+        route_event_debounce = DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS
+    proxy_raw: Any = entry.options.get(
+        CONF_PROXY_PORT,
+        entry.data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+    )
+    try:
+        proxy_port = int(proxy_raw)
+    except (TypeError, ValueError):
+        proxy_port = DEFAULT_PROXY_PORT
 
     client = BlackmagicVideohubClient(host=host, port=port)
     coordinator = BlackmagicVideohubCoordinator(
         hass,
         client=client,
         name=name,
+        entry_id=entry.entry_id,
         update_interval=update_interval,
+        route_event_debounce=route_event_debounce,
+        on_routes_changed=partial(_async_record_tie_line_claims, hass, entry.entry_id),
     )
 
+    await coordinator.async_load_history()
     await coordinator.async_config_entry_first_refresh()
     if coordinator.data is None:
         raise ConfigEntryNotReady("No Videohub data received")
 
-    hass.data[DOMAIN][entry.entry_id] = BlackmagicVideohubRuntimeData(coordinator=coordinator)
+    proxy: VideohubProxyServer | None = None
+    if proxy_port > 0:
+        proxy = VideohubProxyServer(coordinator, port=proxy_port)
+        try:
+            await proxy.async_start()
+        except OSError as err:
+            await coordinator.async_shutdown()
+            raise ConfigEntryNotReady(
+                f"Unable to start Videohub proxy on port {proxy_port}: {err}"
+            ) from err
+
+    hass.data[DOMAIN][entry.entry_id] = BlackmagicVideohubRuntimeData(
+        coordinator=coordinator,
+        proxy=proxy,
+    )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(
+    hass: HomeAssistant, entry: BlackmagicVideohubConfigEntry
+) -> None:
+    """Reload so changed options (scan interval, debounce, proxy port) apply."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: BlackmagicVideohubConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        runtime: BlackmagicVideohubRuntimeData | None = hass.data[DOMAIN].pop(
+            entry.entry_id, None
+        )
+        if runtime is not None:
+            if runtime.proxy is not None:
+                await runtime.proxy.async_stop()
+            await runtime.coordinator.async_shutdown()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: BlackmagicVideohubConfigEntry) -> None:
+    await Store(hass, STORAGE_VERSION, history_storage_key(entry.entry_id)).async_remove()
+
+
+@callback
+def _async_record_tie_line_claims(hass: HomeAssistant, entry_id: str, outputs: list[int]) -> None:
+    """Claim tie-lines for routes made outside `route_path` (panels, proxy, services)."""
+    topology: TieLineTopology | None = hass.data.get(DATA_TOPOLOGY)
+    if topology is None:
+        return
+    routers = _routers(hass)
+    for output_index in outputs:
+        topology.record_route(routers, entry_id, output_index)
+
+
+def _routers(hass: HomeAssistant) -> dict[str, VideohubState]:
+    runtimes: dict[str, BlackmagicVideohubRuntimeData] = hass.data.get(DOMAIN, {})
+    return {
+        entry_id: runtime.coordinator.data
+        for entry_id, runtime in runtimes.items()
+        if runtime.coordinator.data is not None
+    }
+
+
+def _get_runtime(hass: HomeAssistant, entry_id: str) -> BlackmagicVideohubRuntimeData:
+    runtime: BlackmagicVideohubRuntimeData | None = hass.data.get(DOMAIN, {}).get(entry_id)
+    if runtime is None:
+        raise HomeAssistantError(
+            f"No Blackmagic Videohub config entry loaded for entry_id={entry_id}"
+        )
+    return runtime
+
+
+def _resolve_output(coordinator: BlackmagicVideohubCoordinator, data: Mapping[str, Any]) -> int:
+    if ATTR_OUTPUT in data:
+        return data[ATTR_OUTPUT]
+    try:
+        return coordinator.output_label_index.lookup(data[ATTR_OUTPUT_LABEL])
+    except LabelLookupError as err:
+        raise HomeAssistantError(
+            f"Output label lookup failed on {coordinator.name}: {err}"
+        ) from err
+
+
+def _resolve_input(coordinator: BlackmagicVideohubCoordinator, data: Mapping[str, Any]) -> int:
+    if ATTR_INPUT in data:
+        return data[ATTR_INPUT]
+    try:
+        return coordinator.input_label_index.lookup(data[ATTR_INPUT_LABEL])
+    except LabelLookupError as err:
+        raise HomeAssistantError(
+            f"Input label lookup failed on {coordinator.name}: {err}"
+        ) from err
+
+
 def _make_route_output_service_handler(hass: HomeAssistant):
     async def _handle_route_output(call: ServiceCall) -> None:
         entry_id = call.data[ATTR_ENTRY_ID]
-        output_index = call.data[ATTR_OUTPUT]
-        input_index = call.data[ATTR_INPUT]
-
-        runtime: BlackmagicVideohubRuntimeData | None = hass.data.get(DOMAIN, {}).get(entry_id)
-        if runtime is None:
-            raise HomeAssistantError(
-                f"No Blackmagic Videohub config entry loaded for entry_id={entry_id}"
-            )
+        runtime = _get_runtime(hass, entry_id)
+        output_index = _resolve_output(runtime.coordinator, call.data)
+        input_index = _resolve_input(runtime.coordinator, call.data)
 
         try:
             await runtime.coordinator.async_set_route(output_index, input_index)
@@ -120,3 +432,147 @@ def _make_route_output_service_handler(hass: HomeAssistant):
             ) from err
 
     return _handle_route_output
+
+
+def _make_route_path_service_handler(hass: HomeAssistant):
+    async def _handle_route_path(call: ServiceCall) -> ServiceResponse:
+        source_entry_id = call.data[ATTR_SOURCE_ENTRY_ID]
+        entry_id = call.data[ATTR_ENTRY_ID]
+        source = _get_runtime(hass, source_entry_id)
+        destination = _get_runtime(hass, entry_id)
+        input_index = _resolve_input(source.coordinator, call.data)
+        output_index = _resolve_output(destination.coordinator, call.data)
+
+        destination_state = destination.coordinator.data
+        if destination_state is not None and destination_state.is_output_locked(output_index):
+            raise HomeAssistantError(f"Output {output_index} on {entry_id} is locked")
+
+        runtimes: dict[str, BlackmagicVideohubRuntimeData] = hass.data.get(DOMAIN, {})
+        routers = _routers(hass)
+        topology: TieLineTopology = hass.data[DATA_TOPOLOGY]
+        path = topology.find_path(
+            routers,
+            source_entry_id=source_entry_id,
+            input_index=input_index,
+            destination_entry_id=entry_id,
+            output_index=output_index,
+        )
+        if path is None:
+            raise HomeAssistantError(
+                f"No free tie-line path from input {input_index} on {source_entry_id} "
+                f"to output {output_index} on {entry_id}"
+            )
+
+        hops = path.hops
+        results = await asyncio.gather(
+            *(
+                runtimes[hop.entry_id].coordinator.async_set_route(hop.output, hop.input)
+                for hop in hops
+            ),
+            return_exceptions=True,
+        )
+        # Claims only count while the destination is still routed through them,
+        # so recording them before checking for failed hops is safe.
+        topology.claim(path.tie_lines, entry_id, output_index)
+        for hop, result in zip(hops, results):
+            if isinstance(result, Exception):
+                raise HomeAssistantError(
+                    f"Failed to route output {hop.output} to input {hop.input} "
+                    f"on {hop.entry_id}: {result}"
+                ) from result
+
+        return {
+            ATTR_HOPS: [
+                {ATTR_ENTRY_ID: hop.entry_id, ATTR_OUTPUT: hop.output, ATTR_INPUT: hop.input}
+                for hop in hops
+            ]
+        }
+
+    return _handle_route_path
+
+
+def _make_get_route_history_service_handler(hass: HomeAssistant):
+    async def _handle_get_route_history(call: ServiceCall) -> ServiceResponse:
+        runtime = _get_runtime(hass, call.data[ATTR_ENTRY_ID])
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+
+        records = runtime.coordinator.history.query(
+            start=dt_util.as_utc(start).timestamp() if start else None,
+            end=dt_util.as_utc(end).timestamp() if end else None,
+            outputs=call.data.get(ATTR_OUTPUT),
+            limit=call.data[ATTR_LIMIT],
+        )
+        return {
+            ATTR_CHANGES: [
+                {
+                    ATTR_TIME: dt_util.utc_from_timestamp(record.timestamp).isoformat(),
+                    ATTR_OUTPUT: record.output,
+                    ATTR_INPUT: record.input,
+                    ATTR_SOURCE: record.source,
+                }
+                for record in records
+            ]
+        }
+
+    return _handle_get_route_history
+
+
+def _make_export_labels_service_handler(hass: HomeAssistant):
+    async def _handle_export_labels(call: ServiceCall) -> ServiceResponse:
+        runtime = _get_runtime(hass, call.data[ATTR_ENTRY_ID])
+        state = runtime.coordinator.data
+        if state is None:
+            raise HomeAssistantError("No Videohub state available yet")
+
+        if call.data[ATTR_FORMAT] == LABEL_FORMAT_CSV:
+            return {ATTR_CSV: labels_to_csv(state)}
+        return {
+            ATTR_INPUT_LABELS: dict(sorted(state.input_labels.items())),
+            ATTR_OUTPUT_LABELS: dict(sorted(state.output_labels.items())),
+        }
+
+    return _handle_export_labels
+
+
+def _make_import_labels_service_handler(hass: HomeAssistant):
+    async def _handle_import_labels(call: ServiceCall) -> ServiceResponse:
+        runtime = _get_runtime(hass, call.data[ATTR_ENTRY_ID])
+        state = runtime.coordinator.data
+        if state is None:
+            raise HomeAssistantError("No Videohub state available yet")
+
+        input_labels: dict[int, str] = {}
+        output_labels: dict[int, str] = {}
+        if ATTR_CSV in call.data:
+            try:
+                input_labels, output_labels = labels_from_csv(call.data[ATTR_CSV])
+            except ValueError as err:
+                raise HomeAssistantError(f"Invalid label CSV: {err}") from err
+        input_labels.update(call.data.get(ATTR_INPUT_LABELS, {}))
+        output_labels.update(call.data.get(ATTR_OUTPUT_LABELS, {}))
+
+        unknown_inputs = sorted(set(input_labels) - set(state.input_indexes))
+        unknown_outputs = sorted(set(output_labels) - set(state.output_indexes))
+        if unknown_inputs or unknown_outputs:
+            raise HomeAssistantError(
+                f"Unknown Videohub indexes: inputs={unknown_inputs}, outputs={unknown_outputs}"
+            )
+
+        changed_inputs = diff_labels(state.input_labels, input_labels)
+        changed_outputs = diff_labels(state.output_labels, output_labels)
+        if changed_inputs or changed_outputs:
+            try:
+                await runtime.coordinator.async_set_labels(
+                    input_labels=changed_inputs,
+                    output_labels=changed_outputs,
+                )
+            except Exception as err:  # noqa: BLE001
+                raise HomeAssistantError(f"Failed to write Videohub labels: {err}") from err
+
+        return {
+            ATTR_INPUT_LABELS: changed_inputs,
+            ATTR_OUTPUT_LABELS: changed_outputs,
+        }
+
+    return _handle_import_labels
@@ -11,9 +11,13 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
+    CONF_PROXY_PORT,
+    CONF_ROUTE_EVENT_DEBOUNCE,
     CONF_SCAN_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS,
     DEFAULT_SCAN_INTERVAL_SECONDS,
     DOMAIN,
 )
@@ -78,6 +82,13 @@ class BlackmagicVideohubConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_SCAN_INTERVAL,
                         default=DEFAULT_SCAN_INTERVAL_SECONDS,
                     ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_ROUTE_EVENT_DEBOUNCE,
+                        default=DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS,
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    vol.Optional(CONF_PROXY_PORT, default=DEFAULT_PROXY_PORT): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=65535)
+                    ),
                 }
             ),
             errors=errors,
@@ -102,13 +113,29 @@ class BlackmagicVideohubOptionsFlow(config_entries.OptionsFlow):
             CONF_SCAN_INTERVAL,
             self._config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL_SECONDS),
         )
+        current_debounce = self._config_entry.options.get(
+            CONF_ROUTE_EVENT_DEBOUNCE,
+            self._config_entry.data.get(
+                CONF_ROUTE_EVENT_DEBOUNCE, DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS
+            ),
+        )
+        current_proxy_port = self._config_entry.options.get(
+            CONF_PROXY_PORT,
+            self._config_entry.data.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT),
+        )
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Optional(CONF_SCAN_INTERVAL, default=current): vol.All(
                         vol.Coerce(int), vol.Range(min=0, max=3600)
-                    )
+                    ),
+                    vol.Optional(CONF_ROUTE_EVENT_DEBOUNCE, default=current_debounce): vol.All(
+                        vol.Coerce(float), vol.Range(min=0, max=60)
+                    ),
+                    vol.Optional(CONF_PROXY_PORT, default=current_proxy_port): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=65535)
+                    ),
                 }
             ),
         )
@@ -10,13 +10,57 @@ DEFAULT_NAME = "Blackmagic Videohub"
 DEFAULT_PORT = 9990
 DEFAULT_SCAN_INTERVAL_SECONDS = 30
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=DEFAULT_SCAN_INTERVAL_SECONDS)
+DEFAULT_ROUTE_EVENT_DEBOUNCE_SECONDS = 0.0
+DEFAULT_PROXY_PORT = 0
+DEFAULT_HISTORY_SIZE = 200_000
+DEFAULT_HISTORY_QUERY_LIMIT = 1000
+HISTORY_SAVE_DELAY_SECONDS = 300
+TIE_LINE_CLAIMS_SAVE_DELAY_SECONDS = 10
+
+STORAGE_VERSION = 1
+TIE_LINE_CLAIMS_STORAGE_KEY = f"{DOMAIN}.tie_line_claims"
 
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_ROUTE_EVENT_DEBOUNCE = "route_event_debounce"
+CONF_PROXY_PORT = "proxy_port"
+CONF_TIE_LINES = "tie_lines"
+CONF_SOURCE_ENTRY_ID = "source_entry_id"
+CONF_SOURCE_OUTPUT = "source_output"
+CONF_DESTINATION_ENTRY_ID = "destination_entry_id"
+CONF_DESTINATION_INPUT = "destination_input"
+
+DATA_TOPOLOGY = f"{DOMAIN}_topology"
 
 PLATFORMS: list[Platform] = [Platform.SELECT, Platform.MEDIA_PLAYER]
 
 SERVICE_ROUTE_OUTPUT = "route_output"
+SERVICE_GET_ROUTE_HISTORY = "get_route_history"
+SERVICE_ROUTE_PATH = "route_path"
+SERVICE_ROUTE_BY_LABEL = "route_by_label"
+SERVICE_EXPORT_LABELS = "export_labels"
+SERVICE_IMPORT_LABELS = "import_labels"
+
+LABEL_FORMAT_JSON = "json"
+LABEL_FORMAT_CSV = "csv"
+
+EVENT_ROUTES_CHANGED = f"{DOMAIN}_routes_changed"
 
 ATTR_ENTRY_ID = "entry_id"
+ATTR_SOURCE_ENTRY_ID = "source_entry_id"
 ATTR_OUTPUT = "output"
 ATTR_INPUT = "input"
+ATTR_OUTPUT_LABEL = "output_label"
+ATTR_INPUT_LABEL = "input_label"
+ATTR_CHANGES = "changes"
+ATTR_OLD_INPUT = "old_input"
+ATTR_NEW_INPUT = "new_input"
+ATTR_SOURCE = "source"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_LIMIT = "limit"
+ATTR_TIME = "time"
+ATTR_HOPS = "hops"
+ATTR_FORMAT = "format"
+ATTR_CSV = "csv"
+ATTR_INPUT_LABELS = "input_labels"
+ATTR_OUTPUT_LABELS = "output_labels"
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from collections.abc import Callable
+from datetime import datetime, timedelta
 import logging
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .videohub import BlackmagicVideohubClient, VideohubState
+from .const import (
+    ATTR_CHANGES,
+    ATTR_ENTRY_ID,
+    ATTR_NEW_INPUT,
+    ATTR_OLD_INPUT,
+    ATTR_OUTPUT,
+    ATTR_SOURCE,
+    DEFAULT_HISTORY_SIZE,
+    DOMAIN,
+    EVENT_ROUTES_CHANGED,
+    HISTORY_SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+)
+from .history import SOURCE_EXTERNAL, SOURCE_HOME_ASSISTANT, RouteHistory
+from .labels import LabelIndex
+from .videohub import BlackmagicVideohubClient, VideohubState, clean_label
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,7 +40,10 @@ class BlackmagicVideohubCoordinator(DataUpdateCoordinator[VideohubState]):
         *,
         client: BlackmagicVideohubClient,
         name: str,
+        entry_id: str,
         update_interval: timedelta | None,
+        route_event_debounce: float = 0.0,
+        on_routes_changed: Callable[[list[int]], None] | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -29,6 +52,31 @@ class BlackmagicVideohubCoordinator(DataUpdateCoordinator[VideohubState]):
             update_interval=update_interval,
         )
         self.client = client
+        self.entry_id = entry_id
+        self._route_event_debounce = route_event_debounce
+        # Called with the outputs whose input changed, e.g. to update tie-line claims.
+        self._on_routes_changed = on_routes_changed
+        self._last_routing: dict[int, int] | None = None
+        # output -> (old_input, new_input, source) accumulated while debouncing.
+        self._pending_route_changes: dict[int, tuple[int | None, int, str]] = {}
+        self._cancel_route_event: Callable[[], None] | None = None
+        # output -> (input, source) for routes applied through this coordinator,
+        # so the diff can tag where they came from.
+        self._local_routes: dict[int, tuple[int, str]] = {}
+        # Input options and label indexes shared by entities and services,
+        # rebuilt only when labels change.
+        self.input_options: list[str] = []
+        self._option_to_input: dict[str, int] = {}
+        self._input_to_option: dict[int, str] = {}
+        self._cached_input_labels: tuple[dict[int, str], set[int]] | None = None
+        self._cached_output_labels: tuple[dict[int, str], set[int]] | None = None
+        self.input_label_index = LabelIndex({})
+        self.output_label_index = LabelIndex({})
+        self.history = RouteHistory(DEFAULT_HISTORY_SIZE)
+        self._history_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, history_storage_key(entry_id)
+        )
+        self._history_save_pending = False
 
     async def _async_update_data(self) -> VideohubState:
         try:
@@ -36,20 +84,217 @@ class BlackmagicVideohubCoordinator(DataUpdateCoordinator[VideohubState]):
         except Exception as err:  # noqa: BLE001
             raise UpdateFailed(f"Failed to fetch Videohub state: {err}") from err
 
+    async def async_load_history(self) -> None:
+        data = await self._history_store.async_load()
+        if not data:
+            return
+        try:
+            self.history.load(data)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Discarding unreadable routing history for %s: %s", self.name, err)
+
+    async def async_shutdown(self) -> None:
+        if self._cancel_route_event is not None:
+            self._cancel_route_event()
+            self._cancel_route_event = None
+        self._async_fire_routes_changed()
+        self._history_save_pending = False
+        await self._history_store.async_save(self.history.as_dict())
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        self._async_refresh_label_cache()
+        super().async_update_listeners()
+        self._async_track_route_changes()
+
+    def input_option(self, input_index: int) -> str:
+        option = self._input_to_option.get(input_index)
+        if option is None:
+            option = format_input_option(input_index, f"Input {input_index}")
+        return option
+
+    def input_for_option(self, option: str) -> int | None:
+        return self._option_to_input.get(option)
+
     async def async_set_route(self, output_index: int, input_index: int) -> None:
-        await self.client.async_route_output(output_index, input_index)
+        await self.async_set_routes({output_index: input_index})
+
+    async def async_set_routes(
+        self,
+        routes: dict[int, int],
+        *,
+        source: str = SOURCE_HOME_ASSISTANT,
+    ) -> None:
+        await self.client.async_route_outputs(routes)
         if self.data is None:
             return
 
         # Avoid immediate post-route polling; update locally and let normal poll
         # cadence verify state to reduce connection churn on fragile devices.
-        updated = VideohubState(
+        updated = self._clone_state()
+        updated.video_output_routing.update(routes)
+        self._local_routes.update(
+            (output_index, (input_index, source)) for output_index, input_index in routes.items()
+        )
+        self.async_set_updated_data(updated)
+
+    async def async_set_labels(
+        self,
+        *,
+        input_labels: dict[int, str] | None = None,
+        output_labels: dict[int, str] | None = None,
+    ) -> None:
+        await self.client.async_set_labels(input_labels=input_labels, output_labels=output_labels)
+        if self.data is None:
+            return
+
+        # Cache what the client actually sent so the state matches the device.
+        updated = self._clone_state()
+        updated.input_labels.update(
+            {idx: clean_label(label) for idx, label in (input_labels or {}).items()}
+        )
+        updated.output_labels.update(
+            {idx: clean_label(label) for idx, label in (output_labels or {}).items()}
+        )
+        updated.fallback_input_labels.difference_update(input_labels or {})
+        updated.fallback_output_labels.difference_update(output_labels or {})
+        self.async_set_updated_data(updated)
+
+    @callback
+    def _async_refresh_label_cache(self) -> None:
+        if self.data is None:
+            return
+        state = self.data
+        output_key = (state.output_labels, state.fallback_output_labels)
+        if output_key != self._cached_output_labels:
+            self._cached_output_labels = (
+                dict(state.output_labels),
+                set(state.fallback_output_labels),
+            )
+            self.output_label_index = LabelIndex(
+                _reported_labels(state.output_labels, state.fallback_output_labels)
+            )
+        input_key = (state.input_labels, state.fallback_input_labels)
+        if input_key == self._cached_input_labels:
+            return
+        self._cached_input_labels = (dict(state.input_labels), set(state.fallback_input_labels))
+        self.input_label_index = LabelIndex(
+            _reported_labels(state.input_labels, state.fallback_input_labels)
+        )
+        self._input_to_option = {
+            idx: format_input_option(idx, state.input_labels.get(idx, f"Input {idx}"))
+            for idx in state.input_indexes
+        }
+        self._option_to_input = {option: idx for idx, option in self._input_to_option.items()}
+        self.input_options = list(self._input_to_option.values())
+
+    def _clone_state(self) -> VideohubState:
+        assert self.data is not None
+        return VideohubState(
             model_name=self.data.model_name,
             unique_id=self.data.unique_id,
             input_labels=dict(self.data.input_labels),
             output_labels=dict(self.data.output_labels),
             video_output_routing=dict(self.data.video_output_routing),
+            video_output_locks=dict(self.data.video_output_locks),
             device_fields=dict(self.data.device_fields),
+            fallback_input_labels=set(self.data.fallback_input_labels),
+            fallback_output_labels=set(self.data.fallback_output_labels),
         )
-        updated.video_output_routing[output_index] = input_index
-        self.async_set_updated_data(updated)
+
+    @callback
+    def _async_track_route_changes(self) -> None:
+        """Diff routing against the last seen snapshot and queue an event."""
+        if self.data is None:
+            return
+        routing = self.data.video_output_routing
+        previous = self._last_routing
+        local_routes = self._local_routes
+        self._last_routing = dict(routing)
+        self._local_routes = {}
+        if previous is None or routing == previous:
+            # The first snapshot only establishes a baseline.
+            return
+
+        now = dt_util.utcnow().timestamp()
+        changed_outputs: list[int] = []
+        for output_index, input_index in routing.items():
+            old_input = previous.get(output_index)
+            if old_input == input_index:
+                continue
+            changed_outputs.append(output_index)
+            local_input, source = local_routes.get(output_index, (None, SOURCE_EXTERNAL))
+            if local_input != input_index:
+                source = SOURCE_EXTERNAL
+            self.history.append(now, output_index, input_index, source)
+            pending = self._pending_route_changes.get(output_index)
+            if pending is not None:
+                old_input = pending[0]
+            self._pending_route_changes[output_index] = (old_input, input_index, source)
+
+        if self._on_routes_changed is not None and changed_outputs:
+            self._on_routes_changed(changed_outputs)
+        if not self._history_save_pending:
+            # async_delay_save restarts its timer on every call, so only schedule
+            # when idle; otherwise a busy router would never be saved.
+            self._history_save_pending = True
+            self._history_store.async_delay_save(
+                self._history_data_to_save, HISTORY_SAVE_DELAY_SECONDS
+            )
+        if not self._pending_route_changes:
+            return
+        if self._route_event_debounce <= 0:
+            self._async_fire_routes_changed()
+            return
+        if self._cancel_route_event is not None:
+            self._cancel_route_event()
+        self._cancel_route_event = async_call_later(
+            self.hass,
+            self._route_event_debounce,
+            self._async_handle_route_debounce,
+        )
+
+    def _history_data_to_save(self) -> dict[str, Any]:
+        self._history_save_pending = False
+        return self.history.as_dict()
+
+    @callback
+    def _async_handle_route_debounce(self, _now: datetime) -> None:
+        self._cancel_route_event = None
+        self._async_fire_routes_changed()
+
+    @callback
+    def _async_fire_routes_changed(self) -> None:
+        pending = self._pending_route_changes
+        self._pending_route_changes = {}
+        # A burst may route an output away and back again; drop such no-ops.
+        changes = [
+            {
+                ATTR_OUTPUT: output_index,
+                ATTR_OLD_INPUT: old_input,
+                ATTR_NEW_INPUT: new_input,
+                ATTR_SOURCE: source,
+            }
+            for output_index, (old_input, new_input, source) in sorted(pending.items())
+            if old_input != new_input
+        ]
+        if not changes:
+            return
+        self.hass.bus.async_fire(
+            EVENT_ROUTES_CHANGED,
+            {ATTR_ENTRY_ID: self.entry_id, ATTR_CHANGES: changes},
+        )
+
+
+def _reported_labels(labels: dict[int, str], fallbacks: set[int]) -> dict[int, str]:
+    """Drop generated "Input N" names so they cannot collide with real labels."""
+    return {idx: label for idx, label in labels.items() if idx not in fallbacks}
+
+
+def format_input_option(input_index: int, label: str) -> str:
+    return f"{input_index}: {label}"
+
+
+def history_storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.route_history.{entry_id}"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from array import array
+import base64
+from collections.abc import Iterable
+from dataclasses import dataclass
+import sys
+from typing import Any
+
+SOURCE_HOME_ASSISTANT = "home_assistant"
+SOURCE_EXTERNAL = "external"
+SOURCE_PROXY = "proxy"
+
+# Codes are persisted; only ever append new sources.
+_SOURCES = (SOURCE_HOME_ASSISTANT, SOURCE_EXTERNAL, SOURCE_PROXY)
+_SOURCE_CODES = {source: code for code, source in enumerate(_SOURCES)}
+
+
+@dataclass(slots=True)
+class RouteHistoryRecord:
+    """One recorded route change."""
+
+    timestamp: float
+    output: int
+    input: int
+    source: str
+
+
+class RouteHistory:
+    """Fixed-size ring buffer of route changes stored in packed arrays.
+
+    Each record costs 13 bytes (float64 timestamp, uint16 output/input, uint8
+    source), so 200k changes fit in roughly 2.6 MB.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("History capacity must be > 0")
+        self._capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._outputs = array("H", bytes(2 * capacity))
+        self._inputs = array("H", bytes(2 * capacity))
+        self._sources = array("B", bytes(capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, timestamp: float, output: int, input_index: int, source: str) -> None:
+        """Record a change, overwriting the oldest one once full."""
+        if self._size < self._capacity:
+            slot = (self._start + self._size) % self._capacity
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+        self._timestamps[slot] = timestamp
+        self._outputs[slot] = output
+        self._inputs[slot] = input_index
+        self._sources[slot] = _SOURCE_CODES[source]
+
+    def query(
+        self,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+        outputs: Iterable[int] | None = None,
+        limit: int | None = None,
+    ) -> list[RouteHistoryRecord]:
+        """Return changes in [start, end] oldest first, keeping the newest `limit`."""
+        output_filter = set(outputs) if outputs is not None else None
+        first = 0 if start is None else self._bisect(start, right=False)
+        last = self._size if end is None else self._bisect(end, right=True)
+        records: list[RouteHistoryRecord] = []
+        # Walk newest to oldest so `limit` can stop the scan early.
+        for position in range(last - 1, first - 1, -1):
+            slot = (self._start + position) % self._capacity
+            timestamp = self._timestamps[slot]
+            output = self._outputs[slot]
+            if output_filter is not None and output not in output_filter:
+                continue
+            records.append(
+                RouteHistoryRecord(
+                    timestamp=timestamp,
+                    output=output,
+                    input=self._inputs[slot],
+                    source=_SOURCES[self._sources[slot]],
+                )
+            )
+            if limit is not None and len(records) >= limit:
+                break
+        records.reverse()
+        return records
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize to a compact JSON-compatible dict (oldest first)."""
+        return {
+            "byteorder": sys.byteorder,
+            "timestamps": _encode(self._ordered(self._timestamps)),
+            "outputs": _encode(self._ordered(self._outputs)),
+            "inputs": _encode(self._ordered(self._inputs)),
+            "sources": _encode(self._ordered(self._sources)),
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Replace the buffer contents with data produced by `as_dict`."""
+        swap = data.get("byteorder", sys.byteorder) != sys.byteorder
+        timestamps = _decode("d", data["timestamps"], swap)
+        outputs = _decode("H", data["outputs"], swap)
+        inputs = _decode("H", data["inputs"], swap)
+        sources = _decode("B", data["sources"], swap)
+        count = min(len(timestamps), len(outputs), len(inputs), len(sources))
+        offset = max(count - self._capacity, 0)
+
+        self._start = 0
+        self._size = 0
+        for position in range(offset, count):
+            source_code = sources[position]
+            if source_code >= len(_SOURCES):
+                continue
+            self.append(
+                timestamps[position],
+                outputs[position],
+                inputs[position],
+                _SOURCES[source_code],
+            )
+
+    def _ordered(self, values: array) -> array:
+        end = self._start + self._size
+        if end <= self._capacity:
+            return values[self._start:end]
+        return values[self._start:] + values[: end - self._capacity]
+
+    def _bisect(self, timestamp: float, *, right: bool) -> int:
+        """Return the logical position of `timestamp` like bisect_left/right."""
+        low, high = 0, self._size
+        while low < high:
+            mid = (low + high) // 2
+            value = self._timestamps[(self._start + mid) % self._capacity]
+            if value < timestamp or (right and value == timestamp):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+
+def _encode(values: array) -> str:
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(typecode: str, encoded: str, swap: bool) -> array:
+    values = array(typecode)
+    values.frombytes(base64.b64decode(encoded))
+    if swap:
+        values.byteswap()
+    return values
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import csv
+import io
+
+from .videohub import VideohubState, clean_label
+
+LABEL_TYPE_INPUT = "input"
+LABEL_TYPE_OUTPUT = "output"
+
+_CSV_HEADER = ("type", "index", "label")
+
+
+def labels_to_csv(state: VideohubState) -> str:
+    """Serialize input and output labels as `type,index,label` rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_HEADER)
+    for label_type, labels in (
+        (LABEL_TYPE_INPUT, state.input_labels),
+        (LABEL_TYPE_OUTPUT, state.output_labels),
+    ):
+        for idx, label in sorted(labels.items()):
+            writer.writerow((label_type, idx, label))
+    return buffer.getvalue()
+
+
+def labels_from_csv(text: str) -> tuple[dict[int, str], dict[int, str]]:
+    """Parse CSV produced by `labels_to_csv` into input and output labels."""
+    input_labels: dict[int, str] = {}
+    output_labels: dict[int, str] = {}
+    for line_number, row in enumerate(csv.reader(io.StringIO(text)), start=1):
+        if not row or tuple(cell.strip().lower() for cell in row) == _CSV_HEADER:
+            continue
+        if len(row) != 3:
+            raise ValueError(f"Line {line_number}: expected type,index,label")
+        label_type, idx_str, label = (cell.strip() for cell in row)
+        try:
+            idx = int(idx_str)
+        except ValueError as err:
+            raise ValueError(f"Line {line_number}: invalid index {idx_str!r}") from err
+        if not clean_label(label):
+            raise ValueError(f"Line {line_number}: label must not be empty")
+        if label_type.lower() == LABEL_TYPE_INPUT:
+            input_labels[idx] = label
+        elif label_type.lower() == LABEL_TYPE_OUTPUT:
+            output_labels[idx] = label
+        else:
+            raise ValueError(f"Line {line_number}: unknown label type {label_type!r}")
+    return input_labels, output_labels
+
+
+def diff_labels(current: dict[int, str], requested: dict[int, str]) -> dict[int, str]:
+    """Return only the labels that differ from the current ones.
+
+    Whitespace is collapsed the same way the device stores labels, so an
+    import of an unchanged export writes nothing.
+    """
+    changed: dict[int, str] = {}
+    for idx, label in requested.items():
+        cleaned = clean_label(label)
+        if current.get(idx) != cleaned:
+            changed[idx] = cleaned
+    return changed
+
+
+class LabelLookupError(ValueError):
+    """Error to indicate a label matched no index or several indexes."""
+
+
+class LabelIndex:
+    """Case-insensitive label to index lookup."""
+
+    def __init__(self, labels: dict[int, str]) -> None:
+        self._indexes: dict[str, list[int]] = {}
+        for idx, label in sorted(labels.items()):
+            self._indexes.setdefault(normalize_label(label), []).append(idx)
+
+    def lookup(self, label: str) -> int:
+        indexes = self._indexes.get(normalize_label(label))
+        if not indexes:
+            raise LabelLookupError(f"No match for label {label!r}")
+        if len(indexes) > 1:
+            raise LabelLookupError(f"Label {label!r} is ambiguous, matches indexes {indexes}")
+        return indexes[0]
+
+
+def normalize_label(label: str) -> str:
+    return clean_label(label).casefold()
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
 from homeassistant.components.media_player import MediaPlayerEntity
 from homeassistant.components.media_player.const import (
     MediaPlayerEntityFeature,
@@ -10,6 +8,7 @@ from homeassistant.components.media_player.const import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -41,16 +40,6 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-@dataclass(slots=True)
-class VideohubInputSource:
-    index: int
-    label: str
-
-    @property
-    def source_value(self) -> str:
-        return f"{self.index}: {self.label}"
-
-
 class VideohubOutputMediaPlayer(
     CoordinatorEntity[BlackmagicVideohubCoordinator],
     MediaPlayerEntity,
@@ -72,7 +61,6 @@ class VideohubOutputMediaPlayer(
         self._entry = entry
         self._output_index = output_index
         self._attr_unique_id = f"{entry.entry_id}_media_output_route_{output_index}"
-        self._source_to_index: dict[str, int] = {}
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -104,20 +92,7 @@ class VideohubOutputMediaPlayer(
 
     @property
     def source_list(self) -> list[str]:
-        state = self.coordinator.data
-        if state is None:
-            return []
-
-        sources: list[str] = []
-        source_to_index: dict[str, int] = {}
-        for idx in state.input_indexes:
-            label = state.input_labels.get(idx, f"Input {idx}")
-            source = VideohubInputSource(index=idx, label=label).source_value
-            sources.append(source)
-            source_to_index[source] = idx
-
-        self._source_to_index = source_to_index
-        return sources
+        return self.coordinator.input_options
 
     @property
     def source(self) -> str | None:
@@ -127,13 +102,12 @@ class VideohubOutputMediaPlayer(
         input_index = state.video_output_routing.get(self._output_index)
         if input_index is None:
             return None
-        label = state.input_labels.get(input_index, f"Input {input_index}")
-        return VideohubInputSource(index=input_index, label=label).source_value
+        return self.coordinator.input_option(input_index)
 
     async def async_select_source(self, source: str) -> None:
         if source == self.source:
             return
-        if source not in self._source_to_index:
-            _ = self.source_list
-        input_index = self._source_to_index[source]
+        input_index = self.coordinator.input_for_option(source)
+        if input_index is None:
+            raise HomeAssistantError(f"Unknown Videohub input source: {source}")
         await self.coordinator.async_set_route(self._output_index, input_index)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+
+from homeassistant.core import callback
+
+from .coordinator import BlackmagicVideohubCoordinator
+from .history import SOURCE_PROXY
+from .videohub import VideohubState, format_videohub_block, parse_videohub_snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2.8"
+# Drop proxy clients that stop reading instead of buffering for them forever.
+MAX_CLIENT_WRITE_BUFFER = 1024 * 1024
+
+SECTION_INPUT_LABELS = "INPUT LABELS"
+SECTION_OUTPUT_LABELS = "OUTPUT LABELS"
+SECTION_OUTPUT_LOCKS = "VIDEO OUTPUT LOCKS"
+SECTION_OUTPUT_ROUTING = "VIDEO OUTPUT ROUTING"
+
+
+class VideohubProxyServer:
+    """TCP server speaking the Videohub protocol on behalf of one coordinator.
+
+    Snapshots are served from the coordinator's cached state, commands are
+    forwarded through the integration's client and state changes are pushed
+    to every connected proxy client.
+    """
+
+    def __init__(
+        self,
+        coordinator: BlackmagicVideohubCoordinator,
+        *,
+        port: int,
+        host: str | None = None,
+    ) -> None:
+        self._coordinator = coordinator
+        self._host = host
+        self._port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._last_state: VideohubState | None = None
+        self._remove_listener: Callable[[], None] | None = None
+
+    async def async_start(self) -> None:
+        self._server = await asyncio.start_server(self._async_handle_client, self._host, self._port)
+        self._last_state = self._coordinator.data
+        self._remove_listener = self._coordinator.async_add_listener(
+            self._async_handle_coordinator_update
+        )
+        _LOGGER.debug(
+            "Videohub proxy for %s listening on port %s", self._coordinator.name, self._port
+        )
+
+    async def async_stop(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._clients):
+            writer.close()
+        self._clients.clear()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    @callback
+    def _async_handle_coordinator_update(self) -> None:
+        state = self._coordinator.data
+        previous = self._last_state
+        self._last_state = state
+        if state is None or previous is None or not self._clients:
+            return
+
+        payload = "".join(
+            format_videohub_block(header, lines)
+            for header, lines in (
+                (SECTION_INPUT_LABELS, _changed(previous.input_labels, state.input_labels)),
+                (SECTION_OUTPUT_LABELS, _changed(previous.output_labels, state.output_labels)),
+                (
+                    SECTION_OUTPUT_LOCKS,
+                    _changed(previous.video_output_locks, state.video_output_locks),
+                ),
+                (
+                    SECTION_OUTPUT_ROUTING,
+                    _changed(previous.video_output_routing, state.video_output_routing),
+                ),
+            )
+            if lines
+        )
+        if payload:
+            for writer in list(self._clients):
+                self._write(writer, payload)
+
+    async def _async_handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self._clients.add(writer)
+        try:
+            self._write(writer, self._format_prelude())
+            while not writer.is_closing():
+                block = await _async_read_block(reader)
+                if block is None:
+                    break
+                if block:
+                    await self._async_handle_block(writer, block)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _async_handle_block(self, writer: asyncio.StreamWriter, block: list[str]) -> None:
+        header = block[0].rstrip(":").strip().upper()
+        body = block[1:]
+
+        if header == "PING":
+            self._write(writer, "ACK\n\n")
+            return
+
+        state = self._coordinator.data
+        if not body:
+            # A bare header is a request for the current section contents.
+            section = None if state is None else _format_section(state, header)
+            if section is None:
+                self._write(writer, "NAK\n\n")
+                return
+            self._write(writer, "ACK\n\n" + section)
+            return
+
+        # Reuse the snapshot parser so commands are read exactly like device dumps.
+        parsed = parse_videohub_snapshot("\n".join(block).encode("utf-8"))
+        if header == SECTION_OUTPUT_ROUTING and parsed.video_output_routing:
+            self._write(writer, "ACK\n\n")
+            await self._async_forward(
+                self._coordinator.async_set_routes(
+                    parsed.video_output_routing, source=SOURCE_PROXY
+                )
+            )
+        elif header == SECTION_INPUT_LABELS and parsed.input_labels:
+            self._write(writer, "ACK\n\n")
+            await self._async_forward(
+                self._coordinator.async_set_labels(input_labels=parsed.input_labels)
+            )
+        elif header == SECTION_OUTPUT_LABELS and parsed.output_labels:
+            self._write(writer, "ACK\n\n")
+            await self._async_forward(
+                self._coordinator.async_set_labels(output_labels=parsed.output_labels)
+            )
+        else:
+            # Locks cannot be held on behalf of proxy clients over a shared session.
+            self._write(writer, "NAK\n\n")
+
+    async def _async_forward(self, command: Awaitable[None]) -> None:
+        try:
+            await command
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning(
+                "Failed to forward proxy command to %s: %s", self._coordinator.name, err
+            )
+
+    def _format_prelude(self) -> str:
+        parts = [format_videohub_block("PROTOCOL PREAMBLE", [f"Version: {PROTOCOL_VERSION}"])]
+        state = self._coordinator.data
+        if state is not None:
+            parts.append(
+                format_videohub_block(
+                    "VIDEOHUB DEVICE",
+                    (f"{key}: {value}" for key, value in state.device_fields.items()),
+                )
+            )
+            for header in (
+                SECTION_INPUT_LABELS,
+                SECTION_OUTPUT_LABELS,
+                SECTION_OUTPUT_LOCKS,
+                SECTION_OUTPUT_ROUTING,
+            ):
+                parts.append(_format_section(state, header) or "")
+        parts.append(format_videohub_block("END PRELUDE"))
+        return "".join(parts)
+
+    def _write(self, writer: asyncio.StreamWriter, payload: str) -> None:
+        if writer.is_closing():
+            self._clients.discard(writer)
+            return
+        if writer.transport.get_write_buffer_size() > MAX_CLIENT_WRITE_BUFFER:
+            _LOGGER.debug("Dropping stalled Videohub proxy client")
+            self._clients.discard(writer)
+            writer.close()
+            return
+        writer.write(payload.encode("utf-8"))
+
+
+async def _async_read_block(reader: asyncio.StreamReader) -> list[str] | None:
+    """Read lines up to a blank line; None once the client disconnects."""
+    lines: list[str] = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            return lines or None
+        line = raw.decode("utf-8", errors="ignore").rstrip("\r\n")
+        if not line.strip():
+            return lines
+        lines.append(line)
+
+
+def _format_section(state: VideohubState, header: str) -> str | None:
+    if header == SECTION_INPUT_LABELS:
+        values: dict[int, object] = state.input_labels
+    elif header == SECTION_OUTPUT_LABELS:
+        values = state.output_labels
+    elif header == SECTION_OUTPUT_LOCKS:
+        values = state.video_output_locks
+    elif header == SECTION_OUTPUT_ROUTING:
+        values = state.video_output_routing
+    else:
+        return None
+    return format_videohub_block(
+        header, (f"{idx} {value}" for idx, value in sorted(values.items()))
+    )
+
+
+def _changed(previous: dict[int, object], current: dict[int, object]) -> list[str]:
+    return [
+        f"{idx} {value}"
+        for idx, value in sorted(current.items())
+        if previous.get(idx) != value
+    ]
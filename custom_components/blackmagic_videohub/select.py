@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -37,16 +36,6 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-@dataclass(slots=True)
-class VideohubInputOption:
-    index: int
-    label: str
-
-    @property
-    def option_value(self) -> str:
-        return f"{self.index}: {self.label}"
-
-
 class VideohubOutputRouteSelect(CoordinatorEntity[BlackmagicVideohubCoordinator], SelectEntity):
     """Select entity representing one Videohub output route."""
 
@@ -63,7 +52,6 @@ class VideohubOutputRouteSelect(CoordinatorEntity[BlackmagicVideohubCoordinator]
         self._entry = entry
         self._output_index = output_index
         self._attr_unique_id = f"{entry.entry_id}_output_route_{output_index}"
-        self._option_to_index: dict[str, int] = {}
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -91,18 +79,7 @@ class VideohubOutputRouteSelect(CoordinatorEntity[BlackmagicVideohubCoordinator]
 
     @property
     def options(self) -> list[str]:
-        state = self.coordinator.data
-        if state is None:
-            return []
-        options: list[str] = []
-        option_to_index: dict[str, int] = {}
-        for idx in state.input_indexes:
-            label = state.input_labels.get(idx, f"Input {idx}")
-            option = VideohubInputOption(index=idx, label=label).option_value
-            options.append(option)
-            option_to_index[option] = idx
-        self._option_to_index = option_to_index
-        return options
+        return self.coordinator.input_options
 
     @property
     def current_option(self) -> str | None:
@@ -112,14 +89,12 @@ class VideohubOutputRouteSelect(CoordinatorEntity[BlackmagicVideohubCoordinator]
         input_index = state.video_output_routing.get(self._output_index)
         if input_index is None:
             return None
-        label = state.input_labels.get(input_index, f"Input {input_index}")
-        return VideohubInputOption(index=input_index, label=label).option_value
+        return self.coordinator.input_option(input_index)
 
     async def async_select_option(self, option: str) -> None:
         if option == self.current_option:
             return
-        if option not in self._option_to_index:
-            # Refresh mapping from latest coordinator state if needed.
-            _ = self.options
-        input_index = self._option_to_index[option]
+        input_index = self.coordinator.input_for_option(option)
+        if input_index is None:
+            raise HomeAssistantError(f"Unknown Videohub input option: {option}")
         await self.coordinator.async_set_route(self._output_index, input_index)
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .videohub import VideohubState
+
+
+@dataclass(frozen=True, slots=True)
+class TieLine:
+    """Physical link from an output of one Videohub to an input of another."""
+
+    source_entry_id: str
+    source_output: int
+    destination_entry_id: str
+    destination_input: int
+
+
+@dataclass(frozen=True, slots=True)
+class RouteHop:
+    """One routing command needed to complete a path."""
+
+    entry_id: str
+    output: int
+    input: int
+
+
+@dataclass(frozen=True, slots=True)
+class RoutePath:
+    """Routing commands for a path and the tie-lines it runs over."""
+
+    hops: list[RouteHop]
+    tie_lines: list[TieLine]
+
+
+class TieLineTopology:
+    """Tie-line graph across Videohub config entries.
+
+    Each tie-line keeps the set of destination outputs it has been claimed
+    for, either by `route_path` or by any route made from a tie-line input.
+    A claim stays active only while that output is still routed back through
+    the tie-line; unclaimed tie-lines are free to use, since every Videohub
+    output always has some input routed.
+    """
+
+    def __init__(
+        self,
+        tie_lines: Iterable[TieLine],
+        *,
+        on_claims_changed: Callable[[], None] | None = None,
+    ) -> None:
+        self._by_source: dict[str, list[TieLine]] = defaultdict(list)
+        self._by_destination: dict[tuple[str, int], TieLine] = {}
+        self._source_outputs: set[tuple[str, int]] = set()
+        for tie_line in tie_lines:
+            self._by_source[tie_line.source_entry_id].append(tie_line)
+            self._by_destination[
+                (tie_line.destination_entry_id, tie_line.destination_input)
+            ] = tie_line
+            self._source_outputs.add((tie_line.source_entry_id, tie_line.source_output))
+        self._claims: dict[TieLine, set[tuple[str, int]]] = {}
+        self._on_claims_changed = on_claims_changed
+        self._save_pending = False
+
+    def claim(self, tie_lines: Iterable[TieLine], entry_id: str, output_index: int) -> None:
+        """Record that the tie-lines now feed the destination output."""
+        destination = (entry_id, output_index)
+        claimed = set(tie_lines)
+        released = {
+            tie_line
+            for tie_line, destinations in self._claims.items()
+            if destination in destinations
+        }
+        for tie_line in released - claimed:
+            destinations = self._claims[tie_line]
+            destinations.discard(destination)
+            if not destinations:
+                del self._claims[tie_line]
+        for tie_line in claimed - released:
+            self._claims.setdefault(tie_line, set()).add(destination)
+        if claimed != released:
+            self._async_claims_changed()
+
+    def record_route(
+        self,
+        routers: Mapping[str, VideohubState],
+        entry_id: str,
+        output_index: int,
+    ) -> None:
+        """Update claims after an output was routed by any means.
+
+        Outputs that feed a tie-line are intermediate hops and claim nothing
+        themselves; the output at the end of the chain claims every tie-line
+        it is currently fed through, or releases its claims if none.
+        """
+        if (entry_id, output_index) in self._source_outputs:
+            return
+        self.claim(self._trace_upstream(routers, entry_id, output_index), entry_id, output_index)
+
+    def claims_as_dict(self) -> dict[str, Any]:
+        """Serialize claims for storage; marks any pending save as taken."""
+        self._save_pending = False
+        return {
+            "claims": [
+                {
+                    "tie_line": [
+                        tie_line.source_entry_id,
+                        tie_line.source_output,
+                        tie_line.destination_entry_id,
+                        tie_line.destination_input,
+                    ],
+                    "destinations": sorted([list(item) for item in destinations]),
+                }
+                for tie_line, destinations in self._claims.items()
+            ]
+        }
+
+    def load_claims(self, data: dict[str, Any]) -> None:
+        """Restore claims saved by `claims_as_dict`, ignoring removed tie-lines."""
+        known = set(self._by_destination.values())
+        self._claims = {}
+        for item in data.get("claims", []):
+            source_entry_id, source_output, destination_entry_id, destination_input = item[
+                "tie_line"
+            ]
+            tie_line = TieLine(
+                source_entry_id, source_output, destination_entry_id, destination_input
+            )
+            if tie_line not in known:
+                continue
+            self._claims[tie_line] = {
+                (entry_id, output_index) for entry_id, output_index in item["destinations"]
+            }
+
+    def _async_claims_changed(self) -> None:
+        # Notify once per pending save so a delayed store save is not pushed back
+        # by every change.
+        if self._on_claims_changed is None or self._save_pending:
+            return
+        self._save_pending = True
+        self._on_claims_changed()
+
+    def find_path(
+        self,
+        routers: Mapping[str, VideohubState],
+        *,
+        source_entry_id: str,
+        input_index: int,
+        destination_entry_id: str,
+        output_index: int,
+    ) -> RoutePath | None:
+        """Return the cheapest path routing the source input to the destination output.
+
+        Tie-lines already carrying the source are free, so existing paths are
+        reused; otherwise each newly used tie-line costs one. Tie-lines with an
+        active claim for another destination, and locked outputs, are skipped.
+        Returns None when no path exists.
+        """
+        destination = (destination_entry_id, output_index)
+        busy = self._active_claims(routers)
+        # 0-1 BFS over (router, input carrying the signal) nodes.
+        start = (source_entry_id, input_index)
+        distances: dict[tuple[str, int], int] = {start: 0}
+        previous: dict[tuple[str, int], tuple[tuple[str, int], TieLine, RouteHop | None]] = {}
+        queue: deque[tuple[int, tuple[str, int]]] = deque([(0, start)])
+
+        while queue:
+            distance, node = queue.popleft()
+            if distance > distances[node]:
+                continue
+            entry_id, carried_input = node
+            if entry_id == destination_entry_id:
+                return self._build_path(previous, node, output_index, routers)
+
+            state = routers.get(entry_id)
+            if state is None:
+                continue
+            for tie_line in self._by_source.get(entry_id, ()):
+                if tie_line.destination_entry_id not in routers:
+                    continue
+                hop: RouteHop | None = None
+                if state.video_output_routing.get(tie_line.source_output) != carried_input:
+                    if state.is_output_locked(tie_line.source_output):
+                        continue
+                    if busy.get(tie_line, set()) - {destination}:
+                        continue
+                    hop = RouteHop(entry_id, tie_line.source_output, carried_input)
+
+                next_node = (tie_line.destination_entry_id, tie_line.destination_input)
+                next_distance = distance + (0 if hop is None else 1)
+                if next_distance >= distances.get(next_node, next_distance + 1):
+                    continue
+                distances[next_node] = next_distance
+                previous[next_node] = (node, tie_line, hop)
+                if hop is None:
+                    queue.appendleft((next_distance, next_node))
+                else:
+                    queue.append((next_distance, next_node))
+
+        return None
+
+    def _active_claims(
+        self, routers: Mapping[str, VideohubState]
+    ) -> dict[TieLine, set[tuple[str, int]]]:
+        """Return claims whose destination is still fed through the tie-line."""
+        traced: dict[tuple[str, int], set[TieLine]] = {}
+        active: dict[TieLine, set[tuple[str, int]]] = {}
+        for tie_line, destinations in self._claims.items():
+            for destination in destinations:
+                upstream = traced.get(destination)
+                if upstream is None:
+                    upstream = traced[destination] = self._trace_upstream(routers, *destination)
+                if tie_line in upstream:
+                    active.setdefault(tie_line, set()).add(destination)
+        return active
+
+    def _trace_upstream(
+        self,
+        routers: Mapping[str, VideohubState],
+        entry_id: str,
+        output_index: int,
+    ) -> set[TieLine]:
+        tie_lines: set[TieLine] = set()
+        while (state := routers.get(entry_id)) is not None:
+            input_index = state.video_output_routing.get(output_index)
+            tie_line = self._by_destination.get((entry_id, input_index))
+            if tie_line is None or tie_line in tie_lines:
+                break
+            tie_lines.add(tie_line)
+            entry_id, output_index = tie_line.source_entry_id, tie_line.source_output
+        return tie_lines
+
+    @staticmethod
+    def _build_path(
+        previous: dict[tuple[str, int], tuple[tuple[str, int], TieLine, RouteHop | None]],
+        node: tuple[str, int],
+        output_index: int,
+        routers: Mapping[str, VideohubState],
+    ) -> RoutePath:
+        entry_id, carried_input = node
+        hops: list[RouteHop] = []
+        tie_lines: list[TieLine] = []
+        state = routers[entry_id]
+        if state.video_output_routing.get(output_index) != carried_input:
+            hops.append(RouteHop(entry_id, output_index, carried_input))
+        while node in previous:
+            node, tie_line, hop = previous[node]
+            tie_lines.append(tie_line)
+            if hop is not None:
+                hops.append(hop)
+        hops.reverse()
+        tie_lines.reverse()
+        return RoutePath(hops=hops, tie_lines=tie_lines)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 import logging
 
@@ -16,7 +17,11 @@ class VideohubState:
     input_labels: dict[int, str] = field(default_factory=dict)
     output_labels: dict[int, str] = field(default_factory=dict)
     video_output_routing: dict[int, int] = field(default_factory=dict)
+    video_output_locks: dict[int, str] = field(default_factory=dict)
     device_fields: dict[str, str] = field(default_factory=dict)
+    # Indexes whose label was generated by the parser rather than reported.
+    fallback_input_labels: set[int] = field(default_factory=set)
+    fallback_output_labels: set[int] = field(default_factory=set)
 
     @property
     def output_indexes(self) -> list[int]:
@@ -28,6 +33,10 @@ class VideohubState:
         keys = set(self.input_labels) | set(self.video_output_routing.values())
         return sorted(keys)
 
+    def is_output_locked(self, output_index: int) -> bool:
+        """Return True if another client holds a lock on the output."""
+        return self.video_output_locks.get(output_index, "U") != "U"
+
 
 class BlackmagicVideohubClient:
     """Minimal TCP client for the Blackmagic Videohub text protocol."""
@@ -70,9 +79,42 @@ class BlackmagicVideohubClient:
 
     async def async_route_output(self, output_index: int, input_index: int) -> None:
         """Route one output to one input."""
-        if output_index < 0 or input_index < 0:
+        await self.async_route_outputs({output_index: input_index})
+
+    async def async_route_outputs(self, routes: dict[int, int]) -> None:
+        """Route several outputs in a single routing block."""
+        if any(idx < 0 for pair in routes.items() for idx in pair):
             raise ValueError("Routing indexes must be >= 0")
+        if not routes:
+            return
+
+        await self._async_send(
+            format_videohub_block(
+                "VIDEO OUTPUT ROUTING",
+                (f"{output_index} {input_index}" for output_index, input_index in routes.items()),
+            )
+        )
+
+    async def async_set_labels(
+        self,
+        *,
+        input_labels: dict[int, str] | None = None,
+        output_labels: dict[int, str] | None = None,
+    ) -> None:
+        """Write input and/or output labels, one block each, over one connection."""
+        blocks: list[str] = []
+        for header, labels in (("INPUT LABELS", input_labels), ("OUTPUT LABELS", output_labels)):
+            if labels:
+                blocks.append(
+                    format_videohub_block(
+                        header,
+                        (f"{idx} {clean_label(label)}" for idx, label in labels.items()),
+                    )
+                )
+        if blocks:
+            await self._async_send("".join(blocks))
 
+    async def _async_send(self, payload: str) -> None:
         async with self._op_lock:
             loop = asyncio.get_running_loop()
             elapsed = loop.time() - self._last_command_at
@@ -85,8 +127,7 @@ class BlackmagicVideohubClient:
             )
             del reader
             try:
-                payload = f"VIDEO OUTPUT ROUTING:\r\n{output_index} {input_index}\r\n\r\n"
-                writer.write(payload.encode("utf-8"))
+                writer.write(payload.replace("\n", "\r\n").encode("utf-8"))
                 await asyncio.wait_for(writer.drain(), timeout=self._connect_timeout)
                 await asyncio.sleep(0.05)
             finally:
@@ -169,10 +210,28 @@ def parse_videohub_snapshot(raw: bytes) -> VideohubState:
                 state.video_output_routing[output_idx] = input_idx
             continue
 
+        if section == "VIDEO OUTPUT LOCKS":
+            parsed = _parse_index_and_text(line)
+            if parsed:
+                output_idx, lock = parsed
+                state.video_output_locks[output_idx] = lock.upper()
+            continue
+
     _ensure_fallback_labels(state)
     return state
 
 
+def format_videohub_block(header: str, lines: Iterable[str] = ()) -> str:
+    """Format one protocol block terminated by a blank line."""
+    body = "".join(f"{line}\n" for line in lines)
+    return f"{header}:\n{body}\n"
+
+
+def clean_label(label: str) -> str:
+    """Collapse whitespace so a label fits on one protocol line."""
+    return " ".join(label.split())
+
+
 def _parse_key_value(line: str) -> tuple[str, str] | tuple[None, None]:
     if ":" not in line:
         return None, None
@@ -203,6 +262,10 @@ def _parse_index_pair(line: str) -> tuple[int, int] | None:
 
 def _ensure_fallback_labels(state: VideohubState) -> None:
     for idx in state.input_indexes:
-        state.input_labels.setdefault(idx, f"Input {idx}")
+        if idx not in state.input_labels:
+            state.input_labels[idx] = f"Input {idx}"
+            state.fallback_input_labels.add(idx)
     for idx in state.output_indexes:
-        state.output_labels.setdefault(idx, f"Output {idx}")
+        if idx not in state.output_labels:
+            state.output_labels[idx] = f"Output {idx}"
+            state.fallback_output_labels.add(idx)
@@ -0,0 +1 @@
+"""Tests for the Blackmagic Videohub integration."""
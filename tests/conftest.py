@@ -0,0 +1,11 @@
+"""Fixtures for Blackmagic Videohub tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow Home Assistant to load the integration from custom_components."""
+    yield
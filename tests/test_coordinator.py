@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.blackmagic_videohub.const import EVENT_ROUTES_CHANGED
+from custom_components.blackmagic_videohub.coordinator import BlackmagicVideohubCoordinator
+from custom_components.blackmagic_videohub.history import (
+    SOURCE_EXTERNAL,
+    SOURCE_HOME_ASSISTANT,
+    SOURCE_PROXY,
+)
+from custom_components.blackmagic_videohub.videohub import VideohubState
+
+ENTRY_ID = "videohub_entry"
+
+
+class _StubClient:
+    """Client double that accepts routes without a device."""
+
+    async def async_route_outputs(self, routes: dict[int, int]) -> None:
+        pass
+
+
+def _coordinator(
+    hass: HomeAssistant, *, route_event_debounce: float = 0.0
+) -> BlackmagicVideohubCoordinator:
+    coordinator = BlackmagicVideohubCoordinator(
+        hass,
+        client=_StubClient(),  # type: ignore[arg-type]
+        name="Videohub",
+        entry_id=ENTRY_ID,
+        update_interval=None,
+        route_event_debounce=route_event_debounce,
+    )
+    # The first snapshot only establishes the baseline.
+    coordinator.async_set_updated_data(_poll({0: 0, 1: 1, 2: 2}))
+    return coordinator
+
+
+def _poll(routing: dict[int, int]) -> VideohubState:
+    return VideohubState(video_output_routing=dict(routing))
+
+
+def _change(output: int, old_input: int, new_input: int, source: str) -> dict[str, object]:
+    return {"output": output, "old_input": old_input, "new_input": new_input, "source": source}
+
+
+async def test_changes_are_diffed_and_tagged_by_source(hass: HomeAssistant) -> None:
+    events = async_capture_events(hass, EVENT_ROUTES_CHANGED)
+    coordinator = _coordinator(hass)
+
+    await coordinator.async_set_routes({0: 2})
+    await coordinator.async_set_routes({1: 0}, source=SOURCE_PROXY)
+    # A poll showing a route made elsewhere, with the earlier routes unchanged.
+    coordinator.async_set_updated_data(_poll({0: 2, 1: 0, 2: 1}))
+    await hass.async_block_till_done()
+
+    assert [event.data for event in events] == [
+        {"entry_id": ENTRY_ID, "changes": [_change(0, 0, 2, SOURCE_HOME_ASSISTANT)]},
+        {"entry_id": ENTRY_ID, "changes": [_change(1, 1, 0, SOURCE_PROXY)]},
+        {"entry_id": ENTRY_ID, "changes": [_change(2, 2, 1, SOURCE_EXTERNAL)]},
+    ]
+    assert [
+        (record.output, record.input, record.source) for record in coordinator.history.query()
+    ] == [
+        (0, 2, SOURCE_HOME_ASSISTANT),
+        (1, 0, SOURCE_PROXY),
+        (2, 1, SOURCE_EXTERNAL),
+    ]
+
+
+async def test_burst_is_merged_into_one_event(hass: HomeAssistant) -> None:
+    events = async_capture_events(hass, EVENT_ROUTES_CHANGED)
+    coordinator = _coordinator(hass, route_event_debounce=1.0)
+
+    coordinator.async_set_updated_data(_poll({0: 1, 1: 1, 2: 2}))
+    coordinator.async_set_updated_data(_poll({0: 2, 1: 0, 2: 2}))
+    await hass.async_block_till_done()
+    assert events == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    # Output 0 keeps the input it had before the burst.
+    assert [event.data for event in events] == [
+        {
+            "entry_id": ENTRY_ID,
+            "changes": [_change(0, 0, 2, SOURCE_EXTERNAL), _change(1, 1, 0, SOURCE_EXTERNAL)],
+        }
+    ]
+
+
+async def test_route_away_and_back_is_not_reported(hass: HomeAssistant) -> None:
+    events = async_capture_events(hass, EVENT_ROUTES_CHANGED)
+    coordinator = _coordinator(hass, route_event_debounce=1.0)
+
+    coordinator.async_set_updated_data(_poll({0: 1, 1: 1, 2: 2}))
+    coordinator.async_set_updated_data(_poll({0: 0, 1: 1, 2: 2}))
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    assert events == []
+    # History still records both changes.
+    assert [record.input for record in coordinator.history.query(outputs=[0])] == [1, 0]
+
+
+async def test_shutdown_flushes_pending_event(hass: HomeAssistant) -> None:
+    events = async_capture_events(hass, EVENT_ROUTES_CHANGED)
+    coordinator = _coordinator(hass, route_event_debounce=60.0)
+
+    await coordinator.async_set_routes({2: 0})
+    await coordinator.async_shutdown()
+    await hass.async_block_till_done()
+
+    assert [event.data["changes"] for event in events] == [
+        [_change(2, 2, 0, SOURCE_HOME_ASSISTANT)]
+    ]
+    # The cancelled debounce timer must not fire a second event.
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=120))
+    await hass.async_block_till_done()
+    assert len(events) == 1
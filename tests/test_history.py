@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from custom_components.blackmagic_videohub.history import (
+    SOURCE_EXTERNAL,
+    SOURCE_HOME_ASSISTANT,
+    RouteHistory,
+)
+
+
+def _filled_history() -> RouteHistory:
+    history = RouteHistory(5)
+    for step in range(8):
+        source = SOURCE_EXTERNAL if step % 2 else SOURCE_HOME_ASSISTANT
+        history.append(float(step), step % 3, step, source)
+    return history
+
+
+def test_query_time_range_after_wraparound() -> None:
+    history = _filled_history()
+
+    records = history.query(start=4.0, end=6.0)
+
+    assert [record.timestamp for record in records] == [4.0, 5.0, 6.0]
+
+
+def test_query_end_with_limit_returns_latest_before_end() -> None:
+    history = _filled_history()
+
+    records = history.query(end=6.5, outputs=[1], limit=1)
+
+    assert [(record.timestamp, record.input) for record in records] == [(4.0, 4)]
+
+
+def test_round_trip_through_storage_format() -> None:
+    history = _filled_history()
+    restored = RouteHistory(3)
+
+    restored.load(history.as_dict())
+
+    assert [record.timestamp for record in restored.query()] == [5.0, 6.0, 7.0]
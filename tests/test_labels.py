@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.blackmagic_videohub.labels import (
+    LabelIndex,
+    LabelLookupError,
+    diff_labels,
+    labels_from_csv,
+)
+from custom_components.blackmagic_videohub.videohub import parse_videohub_snapshot
+
+
+def test_labels_from_csv_round_trip_values() -> None:
+    input_labels, output_labels = labels_from_csv(
+        'type,index,label\ninput,0,"Cam, 1"\noutput,2,Program\n'
+    )
+
+    assert input_labels == {0: "Cam, 1"}
+    assert output_labels == {2: "Program"}
+
+
+def test_labels_from_csv_rejects_empty_label() -> None:
+    with pytest.raises(ValueError, match="must not be empty"):
+        labels_from_csv("type,index,label\ninput,0,   \n")
+
+
+def test_diff_labels_ignores_whitespace_only_changes() -> None:
+    assert diff_labels({0: "Cam 1", 1: "Cam 2"}, {0: " Cam  1 ", 1: "Wide"}) == {1: "Wide"}
+
+
+def test_parser_marks_generated_fallback_labels() -> None:
+    state = parse_videohub_snapshot(
+        b"INPUT LABELS:\n5 Input 3\n\nVIDEO OUTPUT ROUTING:\n0 3\n1 5\n\n"
+    )
+
+    assert state.input_labels == {3: "Input 3", 5: "Input 3"}
+    assert state.fallback_input_labels == {3}
+    assert state.fallback_output_labels == {0, 1}
+
+
+def test_label_index_lookup_is_case_insensitive_and_reports_ambiguity() -> None:
+    index = LabelIndex({0: "Cam 1", 1: "cam  2", 2: "CAM 2"})
+
+    assert index.lookup(" cam 1 ") == 0
+    with pytest.raises(LabelLookupError, match=r"ambiguous.*\[1, 2\]"):
+        index.lookup("Cam 2")
+    with pytest.raises(LabelLookupError, match="No match"):
+        index.lookup("Cam 9")
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import replace
+import socket
+
+import pytest
+
+from custom_components.blackmagic_videohub import proxy as proxy_module
+from custom_components.blackmagic_videohub.history import SOURCE_PROXY
+from custom_components.blackmagic_videohub.proxy import VideohubProxyServer
+from custom_components.blackmagic_videohub.videohub import VideohubState
+
+HOST = "127.0.0.1"
+
+# The proxy is exercised over real loopback sockets.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+class _StubCoordinator:
+    """Coordinator double recording the commands forwarded by the proxy."""
+
+    name = "Stub Videohub"
+
+    def __init__(self, state: VideohubState) -> None:
+        self.data = state
+        self.routes: list[tuple[dict[int, int], str]] = []
+        self.labels: list[tuple[dict[int, str] | None, dict[int, str] | None]] = []
+        self._listeners: list[Callable[[], None]] = []
+
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def async_set_updated_data(self, state: VideohubState) -> None:
+        self.data = state
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    async def async_set_routes(self, routes: dict[int, int], *, source: str) -> None:
+        self.routes.append((routes, source))
+
+    async def async_set_labels(
+        self,
+        *,
+        input_labels: dict[int, str] | None = None,
+        output_labels: dict[int, str] | None = None,
+    ) -> None:
+        self.labels.append((input_labels, output_labels))
+
+
+def _state() -> VideohubState:
+    return VideohubState(
+        input_labels={0: "Cam 1", 1: "Cam 2"},
+        output_labels={0: "Program", 1: "Preview"},
+        video_output_routing={0: 0, 1: 1},
+        video_output_locks={0: "U", 1: "L"},
+        device_fields={"Model name": "Smart Videohub"},
+    )
+
+
+@pytest.fixture
+def coordinator() -> _StubCoordinator:
+    return _StubCoordinator(_state())
+
+
+@pytest.fixture
+async def proxy(coordinator: _StubCoordinator) -> AsyncIterator[VideohubProxyServer]:
+    server = VideohubProxyServer(coordinator, port=0, host=HOST)  # type: ignore[arg-type]
+    await server.async_start()
+    yield server
+    await server.async_stop()
+
+
+async def _connect(
+    proxy: VideohubProxyServer, *, receive_buffer: int | None = None
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    port = proxy._server.sockets[0].getsockname()[1]
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if receive_buffer is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, (HOST, port))
+    reader, writer = await asyncio.open_connection(sock=sock)
+    await asyncio.wait_for(reader.readuntil(b"END PRELUDE:\n\n"), 5)
+    return reader, writer
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, block: str
+) -> str:
+    writer.write(block.encode("utf-8"))
+    await writer.drain()
+    return await _read_blocks(reader, 1)
+
+
+async def _read_blocks(reader: asyncio.StreamReader, count: int) -> str:
+    return "".join(
+        [(await asyncio.wait_for(reader.readuntil(b"\n\n"), 5)).decode() for _ in range(count)]
+    )
+
+
+async def test_prelude_is_served_from_cached_state(proxy: VideohubProxyServer) -> None:
+    port = proxy._server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection(HOST, port)
+
+    prelude = await asyncio.wait_for(reader.readuntil(b"END PRELUDE:\n\n"), 5)
+
+    assert prelude.decode() == (
+        "PROTOCOL PREAMBLE:\nVersion: 2.8\n\n"
+        "VIDEOHUB DEVICE:\nModel name: Smart Videohub\n\n"
+        "INPUT LABELS:\n0 Cam 1\n1 Cam 2\n\n"
+        "OUTPUT LABELS:\n0 Program\n1 Preview\n\n"
+        "VIDEO OUTPUT LOCKS:\n0 U\n1 L\n\n"
+        "VIDEO OUTPUT ROUTING:\n0 0\n1 1\n\n"
+        "END PRELUDE:\n\n"
+    )
+    writer.close()
+
+
+async def test_bare_header_and_ping(proxy: VideohubProxyServer) -> None:
+    reader, writer = await _connect(proxy)
+
+    assert await _request(reader, writer, "PING:\n\n") == "ACK\n\n"
+    writer.write(b"VIDEO OUTPUT ROUTING:\n\n")
+    assert await _read_blocks(reader, 2) == "ACK\n\nVIDEO OUTPUT ROUTING:\n0 0\n1 1\n\n"
+    assert await _request(reader, writer, "UNKNOWN SECTION:\n\n") == "NAK\n\n"
+    writer.close()
+
+
+async def test_commands_are_forwarded_as_proxy(
+    proxy: VideohubProxyServer, coordinator: _StubCoordinator
+) -> None:
+    reader, writer = await _connect(proxy)
+
+    assert await _request(reader, writer, "VIDEO OUTPUT ROUTING:\r\n1 0\r\n\r\n") == "ACK\n\n"
+    assert await _request(reader, writer, "INPUT LABELS:\n0 Camera One\n\n") == "ACK\n\n"
+    assert await _request(reader, writer, "OUTPUT LABELS:\n1 Multiview\n\n") == "ACK\n\n"
+    # Blocks are handled in order, so the forwards are done once PING is answered.
+    assert await _request(reader, writer, "PING:\n\n") == "ACK\n\n"
+
+    assert coordinator.routes == [({1: 0}, SOURCE_PROXY)]
+    assert coordinator.labels == [({0: "Camera One"}, None), (None, {1: "Multiview"})]
+    writer.close()
+
+
+async def test_lock_commands_are_rejected(
+    proxy: VideohubProxyServer, coordinator: _StubCoordinator
+) -> None:
+    reader, writer = await _connect(proxy)
+
+    assert await _request(reader, writer, "VIDEO OUTPUT LOCKS:\n0 O\n\n") == "NAK\n\n"
+    assert coordinator.routes == []
+    writer.close()
+
+
+async def test_changed_sections_fan_out_to_all_clients(
+    proxy: VideohubProxyServer, coordinator: _StubCoordinator
+) -> None:
+    first_reader, first_writer = await _connect(proxy)
+    second_reader, second_writer = await _connect(proxy)
+
+    state = coordinator.data
+    coordinator.async_set_updated_data(
+        replace(
+            state,
+            output_labels={**state.output_labels, 1: "Multiview"},
+            video_output_routing={**state.video_output_routing, 1: 0},
+        )
+    )
+
+    expected = "OUTPUT LABELS:\n1 Multiview\n\nVIDEO OUTPUT ROUTING:\n1 0\n\n"
+    assert await _read_blocks(first_reader, 2) == expected
+    assert await _read_blocks(second_reader, 2) == expected
+    first_writer.close()
+    second_writer.close()
+
+
+async def test_stalled_client_is_dropped(
+    proxy: VideohubProxyServer,
+    coordinator: _StubCoordinator,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(proxy_module, "MAX_CLIENT_WRITE_BUFFER", 1024)
+    reader, writer = await _connect(proxy, receive_buffer=4096)
+    (server_writer,) = proxy._clients
+    server_writer.transport.get_extra_info("socket").setsockopt(
+        socket.SOL_SOCKET, socket.SO_SNDBUF, 4096
+    )
+
+    # The client never reads, so the update piles up in the server's buffer.
+    for label in ("x", "y"):
+        coordinator.async_set_updated_data(
+            replace(
+                coordinator.data,
+                input_labels={idx: label * 100 for idx in range(2000)},
+            )
+        )
+
+    assert not proxy._clients
+    assert server_writer.is_closing()
+    writer.close()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from custom_components.blackmagic_videohub.topology import (
+    RouteHop,
+    TieLine,
+    TieLineTopology,
+)
+from custom_components.blackmagic_videohub.videohub import VideohubState
+
+PORTS = 40
+A_TO_B = TieLine("a", 30, "b", 10)
+B_TO_C = TieLine("b", 31, "c", 11)
+
+
+def _identity_router() -> VideohubState:
+    """Factory routing: every output N shows input N."""
+    return VideohubState(video_output_routing={idx: idx for idx in range(PORTS)})
+
+
+def _apply(routers: dict[str, VideohubState], hops: list[RouteHop]) -> None:
+    for hop in hops:
+        routers[hop.entry_id].video_output_routing[hop.output] = hop.input
+
+
+def test_find_path_with_identity_routing() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router(), "c": _identity_router()}
+    topology = TieLineTopology([A_TO_B, B_TO_C])
+
+    path = topology.find_path(
+        routers, source_entry_id="a", input_index=1, destination_entry_id="c", output_index=3
+    )
+
+    assert path is not None
+    assert path.tie_lines == [A_TO_B, B_TO_C]
+    assert path.hops == [
+        RouteHop("a", 30, 1),
+        RouteHop("b", 31, 10),
+        RouteHop("c", 3, 11),
+    ]
+
+
+def test_find_path_reroutes_same_destination() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router(), "c": _identity_router()}
+    topology = TieLineTopology([A_TO_B, B_TO_C])
+    first = topology.find_path(
+        routers, source_entry_id="a", input_index=1, destination_entry_id="c", output_index=3
+    )
+    assert first is not None
+    _apply(routers, first.hops)
+    topology.claim(first.tie_lines, "c", 3)
+
+    second = topology.find_path(
+        routers, source_entry_id="a", input_index=2, destination_entry_id="c", output_index=3
+    )
+
+    assert second is not None
+    assert second.hops == [RouteHop("a", 30, 2)]
+
+
+def test_find_path_skips_tie_line_claimed_for_other_output() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router(), "c": _identity_router()}
+    topology = TieLineTopology([A_TO_B, B_TO_C])
+    first = topology.find_path(
+        routers, source_entry_id="a", input_index=1, destination_entry_id="c", output_index=3
+    )
+    assert first is not None
+    _apply(routers, first.hops)
+    topology.claim(first.tie_lines, "c", 3)
+
+    blocked = topology.find_path(
+        routers, source_entry_id="a", input_index=2, destination_entry_id="c", output_index=4
+    )
+    assert blocked is None
+
+    # Once output 3 is routed elsewhere the claim lapses.
+    routers["c"].video_output_routing[3] = 0
+    freed = topology.find_path(
+        routers, source_entry_id="a", input_index=2, destination_entry_id="c", output_index=4
+    )
+    assert freed is not None
+
+
+def test_find_path_keeps_shared_tie_line_claimed() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router()}
+    topology = TieLineTopology([A_TO_B])
+    for output_index in (3, 4):
+        path = topology.find_path(
+            routers,
+            source_entry_id="a",
+            input_index=1,
+            destination_entry_id="b",
+            output_index=output_index,
+        )
+        assert path is not None
+        _apply(routers, path.hops)
+        topology.claim(path.tie_lines, "b", output_index)
+
+    # Moving output 4 away must not release the tie-line still feeding output 3.
+    routers["b"].video_output_routing[4] = 0
+    topology.claim([], "b", 4)
+
+    blocked = topology.find_path(
+        routers, source_entry_id="a", input_index=2, destination_entry_id="b", output_index=5
+    )
+    assert blocked is None
+
+
+def test_record_route_claims_tie_lines_for_any_route() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router()}
+    topology = TieLineTopology([A_TO_B])
+    # A panel routes the tie-line input to output 3 without route_path.
+    routers["b"].video_output_routing[3] = A_TO_B.destination_input
+    topology.record_route(routers, "b", 3)
+    # Routing the tie-line source itself is an intermediate hop and claims nothing.
+    topology.record_route(routers, "a", A_TO_B.source_output)
+
+    blocked = topology.find_path(
+        routers, source_entry_id="a", input_index=2, destination_entry_id="b", output_index=5
+    )
+    assert blocked is None
+
+    routers["b"].video_output_routing[3] = 0
+    topology.record_route(routers, "b", 3)
+    assert topology.claims_as_dict() == {"claims": []}
+
+
+def test_claims_round_trip_and_notify_once() -> None:
+    routers = {"a": _identity_router(), "b": _identity_router()}
+    notified: list[None] = []
+    topology = TieLineTopology([A_TO_B], on_claims_changed=lambda: notified.append(None))
+    topology.claim([A_TO_B], "b", 3)
+    topology.claim([A_TO_B], "b", 4)
+    assert len(notified) == 1
+
+    data = topology.claims_as_dict()
+    restored = TieLineTopology([A_TO_B])
+    restored.load_claims(data)
+    routers["b"].video_output_routing[3] = A_TO_B.destination_input
+
+    assert restored.claims_as_dict() == data
+    assert (
+        restored.find_path(
+            routers, source_entry_id="a", input_index=2, destination_entry_id="b", output_index=5
+        )
+        is None
+    )
+    # A tie-line removed from configuration drops its saved claims.
+    reconfigured = TieLineTopology([B_TO_C])
+    reconfigured.load_claims(data)
+    assert reconfigured.claims_as_dict() == {"claims": []}